@@ -2,7 +2,6 @@ import time
 from decimal import Decimal
 from typing import List, Optional
 
-import pandas_ta as ta  # noqa: F401
 from pydantic import Field, validator
 
 from hummingbot.client.config.config_data_types import ClientFieldData
@@ -2,7 +2,7 @@ import time
 from decimal import Decimal
 from typing import List, Optional
 
-import pandas_ta as ta  # noqa: F401
+import numpy as np
 from pydantic import Field, validator
 
 from hummingbot.client.config.config_data_types import ClientFieldData
@@ -96,22 +96,28 @@ class DManMakerV2(MarketMakingControllerBase):
         self.dca_amounts_pct = [Decimal(amount) / sum(self.config.dca_amounts) for amount in self.config.dca_amounts]
         self.spreads = self.config.dca_spreads
 
-    def first_level_refresh_condition(self, executor):
-        if self.config.top_executor_refresh_time is not None:
-            if self.get_level_from_level_id(executor.custom_info["level_id"]) == 0:
-                return time.time() - executor.timestamp > self.config.top_executor_refresh_time
-        return False
-
-    def order_level_refresh_condition(self, executor):
-        return time.time() - executor.timestamp > self.config.executor_refresh_time
-
     def executors_to_refresh(self) -> List[ExecutorAction]:
-        executors_to_refresh = self.filter_executors(
-            executors=self.executors_info,
-            filter_func=lambda x: not x.is_trading and x.is_active and (self.order_level_refresh_condition(x) or self.first_level_refresh_condition(x)))
+        executors = self.executors_info
+        if not executors:
+            return []
+        # The refresh mask is evaluated over numpy columns instead of calling the refresh
+        # conditions per executor, which keeps the per-tick cost flat as levels grow
+        now = time.time()
+        count = len(executors)
+        age = now - np.fromiter((executor.timestamp for executor in executors), dtype=np.float64, count=count)
+        eligible = (
+            np.fromiter((executor.is_active for executor in executors), dtype=np.bool_, count=count)
+            & ~np.fromiter((executor.is_trading for executor in executors), dtype=np.bool_, count=count)
+        )
+        refresh = eligible & (age > self.config.executor_refresh_time)
+        if self.config.top_executor_refresh_time is not None:
+            levels = np.fromiter(
+                (self.get_level_from_level_id(executor.custom_info["level_id"]) for executor in executors),
+                dtype=np.int64, count=count)
+            refresh |= eligible & (levels == 0) & (age > self.config.top_executor_refresh_time)
         return [StopExecutorAction(
             controller_id=self.config.id,
-            executor_id=executor.id) for executor in executors_to_refresh]
+            executor_id=executors[index].id) for index in np.flatnonzero(refresh)]
 
     def get_executor_config(self, level_id: str, price: Decimal, amount: Decimal):
         trade_type = self.get_trade_type_from_level_id(level_id)
@@ -2,9 +2,25 @@ import time
 from decimal import Decimal
 from typing import List
 
-import pandas_ta as ta  # noqa: F401
+import numpy as np
 from pydantic import Field, validator
 
+try:
+    import talib
+except ImportError:
+    talib = None
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        # No-op stand-in so the kernel below still runs as plain Python when numba is not installed
+        def decorator(func):
+            return func
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return decorator
+
 from hummingbot.client.config.config_data_types import ClientFieldData
 from hummingbot.core.data_type.common import PriceType
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig
@@ -12,9 +28,39 @@ from hummingbot.smart_components.controllers.market_making_controller_base impor
     MarketMakingControllerBase,
     MarketMakingControllerConfigBase,
 )
+from hummingbot.smart_components.executors.data_types import generate_executor_id
 from hummingbot.smart_components.executors.position_executor.data_types import PositionExecutorConfig
 
 
+@njit(cache=True)
+def _natr_loop(high: np.ndarray, low: np.ndarray, close: np.ndarray, length: int) -> np.ndarray:
+    """
+    Normalized ATR with Wilder smoothing. The recurrence is serial, so it is compiled with numba
+    instead of being vectorized; matches talib.NATR seeding (SMA of the first `length` true ranges).
+    """
+    n = high.shape[0]
+    natr = np.full(n, np.nan)
+    tr_sum = 0.0
+    atr = 0.0
+    for i in range(1, n):
+        tr = high[i] - low[i]
+        high_close = abs(high[i] - close[i - 1])
+        if high_close > tr:
+            tr = high_close
+        low_close = abs(low[i] - close[i - 1])
+        if low_close > tr:
+            tr = low_close
+        if i <= length:
+            tr_sum += tr
+            if i == length:
+                atr = tr_sum / length
+                natr[i] = atr / close[i] * 100.0
+        else:
+            atr = (atr * (length - 1) + tr) / length
+            natr[i] = atr / close[i] * 100.0
+    return natr
+
+
 class PMMDynamicControllerConfig(MarketMakingControllerConfigBase):
     controller_name = "pmm_dynamic"
     candles_config: List[CandlesConfig] = []
@@ -104,15 +150,38 @@ class PMMDynamicController(MarketMakingControllerBase):
                                                            trading_pair=self.config.candles_trading_pair,
                                                            interval=self.config.interval,
                                                            max_records=self.max_records)
-        natr = ta.natr(candles["high"], candles["low"], candles["close"], length=self.config.natr_length) / 100
-        macd_output = ta.macd(candles["close"], fast=self.config.macd_fast, slow=self.config.macd_slow, signal=self.config.macd_signal)
-        macd = macd_output[f"MACD_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
-        macd_signal = - (macd - macd.mean()) / macd.std()
-        macdh = macd_output[f"MACDh_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
-        macdh_signal = macdh.apply(lambda x: 1 if x > 0 else -1)
-        max_price_shift = natr / 2
-        price_multiplier = Decimal(((0.5 * macd_signal + 0.5 * macdh_signal) * max_price_shift).iloc[-1])
-        spread_multiplier = Decimal(natr.iloc[-1])
+        # Extract the column buffers once and reuse them for every indicator in this call;
+        # copy=False reuses the existing block when it is already float64
+        high = candles["high"].to_numpy(dtype=np.float64, copy=False)
+        low = candles["low"].to_numpy(dtype=np.float64, copy=False)
+        close = candles["close"].to_numpy(dtype=np.float64, copy=False)
+        if talib is not None:
+            # TA-Lib runs the indicator recurrences in C over contiguous float64 arrays, which is
+            # orders of magnitude faster than the pandas implementations on this per-tick path.
+            # pandas_ta delegates to TA-Lib when it is installed, so the MACD values are identical.
+            natr = talib.NATR(high, low, close, timeperiod=self.config.natr_length) / 100.0
+            macd, _, macdh = talib.MACD(close, fastperiod=self.config.macd_fast,
+                                        slowperiod=self.config.macd_slow,
+                                        signalperiod=self.config.macd_signal)
+            macd_signal = - (macd - np.nanmean(macd)) / np.nanstd(macd, ddof=1)
+            last_macd_signal = macd_signal[-1]
+            last_macdh_signal = 1 if macdh[-1] > 0 else -1
+        else:
+            natr = _natr_loop(high, low, close, self.config.natr_length) / 100.0
+            # pandas_ta pulls in a heavy import tree, so it is only loaded when the controller
+            # actually ticks instead of at module import
+            import pandas_ta as ta
+
+            macd_output = ta.macd(candles["close"], fast=self.config.macd_fast, slow=self.config.macd_slow, signal=self.config.macd_signal)
+            macd = macd_output[f"MACD_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
+            macd_signal = - (macd - macd.mean()) / macd.std()
+            macdh = macd_output[f"MACDh_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
+            last_macd_signal = macd_signal.iloc[-1]
+            last_macdh_signal = 1 if macdh.iloc[-1] > 0 else -1
+        # Only the last row feeds the multipliers, so the shift is computed for that row alone
+        max_price_shift = natr[-1] / 2
+        price_multiplier = Decimal((0.5 * last_macd_signal + 0.5 * last_macdh_signal) * max_price_shift)
+        spread_multiplier = Decimal(natr[-1])
         mid_price = self.market_data_provider.get_price_by_type(self.config.connector_name, self.config.trading_pair,
                                                                 PriceType.MidPrice)
         reference_price = mid_price * (1 + price_multiplier)
@@ -120,8 +189,13 @@ class PMMDynamicController(MarketMakingControllerBase):
 
     def get_executor_config(self, level_id: str, price: Decimal, amount: Decimal):
         trade_type = self.get_trade_type_from_level_id(level_id)
-        return PositionExecutorConfig(
-            timestamp=time.time(),
+        timestamp = time.time()
+        # Every value passed here already has its final type, so `construct` can skip
+        # pydantic's per-field validation on this per-tick path. Validators do not run
+        # under `construct`, so the id has to be assigned explicitly.
+        return PositionExecutorConfig.construct(
+            id=generate_executor_id(timestamp),
+            timestamp=timestamp,
             level_id=level_id,
             connector_name=self.config.connector_name,
             trading_pair=self.config.trading_pair,
@@ -2,6 +2,7 @@ import time
 from decimal import Decimal
 from typing import List, Optional
 
+import numpy as np
 from pydantic import Field
 
 from hummingbot.client.config.config_data_types import ClientFieldData
@@ -10,6 +11,7 @@ from hummingbot.smart_components.controllers.market_making_controller_base impor
     MarketMakingControllerBase,
     MarketMakingControllerConfigBase,
 )
+from hummingbot.smart_components.executors.data_types import generate_executor_id
 from hummingbot.smart_components.executors.position_executor.data_types import PositionExecutorConfig
 from hummingbot.smart_components.models.executor_actions import ExecutorAction, StopExecutorAction
 
@@ -30,27 +32,38 @@ class PMMSimpleController(MarketMakingControllerBase):
         super().__init__(config, *args, **kwargs)
         self.config = config
 
-    def first_level_refresh_condition(self, executor):
-        if self.config.top_executor_refresh_time is not None:
-            if self.get_level_from_level_id(executor.custom_info["level_id"]) == 0:
-                return time.time() - executor.timestamp > self.config.top_executor_refresh_time
-        return False
-
-    def order_level_refresh_condition(self, executor):
-        return time.time() - executor.timestamp > self.config.executor_refresh_time
-
     def executors_to_refresh(self) -> List[ExecutorAction]:
-        executors_to_refresh = self.filter_executors(
-            executors=self.executors_info,
-            filter_func=lambda x: not x.is_trading and x.is_active and (self.order_level_refresh_condition(x) or self.first_level_refresh_condition(x)))
+        executors = self.executors_info
+        if not executors:
+            return []
+        # The refresh mask is evaluated over numpy columns instead of calling the refresh
+        # conditions per executor, which keeps the per-tick cost flat as levels grow
+        now = time.time()
+        count = len(executors)
+        age = now - np.fromiter((executor.timestamp for executor in executors), dtype=np.float64, count=count)
+        eligible = (
+            np.fromiter((executor.is_active for executor in executors), dtype=np.bool_, count=count)
+            & ~np.fromiter((executor.is_trading for executor in executors), dtype=np.bool_, count=count)
+        )
+        refresh = eligible & (age > self.config.executor_refresh_time)
+        if self.config.top_executor_refresh_time is not None:
+            levels = np.fromiter(
+                (self.get_level_from_level_id(executor.custom_info["level_id"]) for executor in executors),
+                dtype=np.int64, count=count)
+            refresh |= eligible & (levels == 0) & (age > self.config.top_executor_refresh_time)
         return [StopExecutorAction(
             controller_id=self.config.id,
-            executor_id=executor.id) for executor in executors_to_refresh]
+            executor_id=executors[index].id) for index in np.flatnonzero(refresh)]
 
     def get_executor_config(self, level_id: str, price: Decimal, amount: Decimal):
         trade_type = self.get_trade_type_from_level_id(level_id)
-        return PositionExecutorConfig(
-            timestamp=time.time(),
+        timestamp = time.time()
+        # Every value passed here already has its final type, so `construct` can skip
+        # pydantic's per-field validation on this per-tick path. Validators do not run
+        # under `construct`, so the id has to be assigned explicitly.
+        return PositionExecutorConfig.construct(
+            id=generate_executor_id(timestamp),
+            timestamp=timestamp,
             level_id=level_id,
             connector_name=self.config.connector_name,
             trading_pair=self.config.trading_pair,
@@ -1,7 +1,6 @@
 import hashlib
 import hmac
 import json
-from collections import OrderedDict
 from typing import Any, Dict
 from urllib.parse import urlencode
 
@@ -18,11 +17,11 @@ class BinancePerpetualAuth(AuthBase):
     def __init__(self, api_key: str, api_secret: str, time_provider: TimeSynchronizer):
         self._api_key: str = api_key
         self._api_secret: str = api_secret
+        self._secret_bytes = api_secret.encode("utf-8")
         self._time_provider: TimeSynchronizer = time_provider
 
     def generate_signature_from_payload(self, payload: str) -> str:
-        secret = bytes(self._api_secret.encode("utf-8"))
-        signature = hmac.new(secret, payload.encode("utf-8"), hashlib.sha256).hexdigest()
+        signature = hmac.new(self._secret_bytes, payload.encode("utf-8"), hashlib.sha256).hexdigest()
         return signature
 
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
@@ -42,7 +41,7 @@ class BinancePerpetualAuth(AuthBase):
                            params: Dict[str, Any]):
         timestamp = int(self._time_provider.time() * 1e3)
 
-        request_params = OrderedDict(params or {})
+        request_params = dict(params or {})
         request_params["timestamp"] = timestamp
 
         payload = urlencode(request_params)
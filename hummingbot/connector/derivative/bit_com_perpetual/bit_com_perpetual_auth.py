@@ -2,9 +2,8 @@ import hashlib
 import hmac
 import json
 import time
-from collections import OrderedDict
 from typing import Any, Dict
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, WSRequest
@@ -25,7 +24,7 @@ class BitComPerpetualAuth(AuthBase):
         return signature
 
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
-        _path = urlparse(request.url).path
+        _path = urlsplit(request.url).path
         if request.method == RESTMethod.POST:
             request.data = self.add_auth_to_params_post(request.data, _path)
         else:
@@ -72,7 +71,7 @@ class BitComPerpetualAuth(AuthBase):
     def add_auth_to_params(self, params: Dict[str, Any], path):
         timestamp = int(self._get_timestamp() * 1e3)
 
-        request_params = OrderedDict(params or {})
+        request_params = dict(params or {})
         request_params.update({'timestamp': timestamp})
         str_to_sign = path + '&' + self._encode_object(request_params)
         request_params["signature"] = self.generate_signature_from_payload(payload=str_to_sign)
@@ -84,7 +83,7 @@ class BitComPerpetualAuth(AuthBase):
 
         data = json.loads(params) if params is not None else {}
 
-        request_params = OrderedDict(data or {})
+        request_params = dict(data or {})
         request_params.update({'timestamp': timestamp})
         str_to_sign = path + '&' + self._encode_object(request_params)
         request_params["signature"] = self.generate_signature_from_payload(payload=str_to_sign)
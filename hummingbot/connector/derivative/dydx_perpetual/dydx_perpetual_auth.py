@@ -70,17 +70,13 @@ class DydxPerpetualAuth(AuthBase):
             data=remove_nones(json.loads(data)),
         )
 
-        headers = {
+        request.headers = {
             "DYDX-SIGNATURE": signature,
             "DYDX-API-KEY": self._dydx_perpetual_api_key,
             "DYDX-TIMESTAMP": ts,
             "DYDX-PASSPHRASE": self._dydx_perpetual_passphrase,
+            **(request.headers or {}),
         }
-
-        if request.headers is not None:
-            headers.update(request.headers)
-
-        request.headers = headers
         return request
 
     async def ws_authenticate(self, request: WSRequest) -> WSRequest:
@@ -3,7 +3,7 @@ import hmac
 import json
 import time
 from typing import Any, Dict
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 import six
 
@@ -12,6 +12,9 @@ from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTRequest, WSRequest
 
 
+_EMPTY_BODY_HASH = hashlib.sha512().hexdigest()
+
+
 class GateIoPerpetualAuth(AuthBase):
     """
     Auth Gate.io API
@@ -20,13 +23,10 @@ class GateIoPerpetualAuth(AuthBase):
     def __init__(self, api_key: str, secret_key: str):
         self.api_key = api_key
         self.secret_key = secret_key
+        self._secret_bytes = secret_key.encode("utf-8")
 
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
-        headers = {}
-        if request.headers is not None:
-            headers.update(request.headers)
-        headers.update(self._get_auth_headers(request))
-        request.headers = headers
+        request.headers = {**(request.headers or {}), **self._get_auth_headers(request)}
         return request
 
     async def ws_authenticate(self, request: WSRequest) -> WSRequest:
@@ -71,14 +71,15 @@ class GateIoPerpetualAuth(AuthBase):
         body = r.data
 
         ts = self._get_timestamp()
-        m = hashlib.sha512()
-        path = urlparse(r.url).path
+        path = urlsplit(r.url).path
 
         if body is not None:
             if not isinstance(r.data, six.string_types):
                 body = json.dumps(r.data)
-            m.update(body.encode('utf-8'))
-        body_hash = m.hexdigest()
+            body_hash = hashlib.sha512(body.encode('utf-8')).hexdigest()
+        else:
+            # Most private GETs carry no body; reuse the constant digest of the empty input
+            body_hash = _EMPTY_BODY_HASH
 
         if r.params:
             qs = []
@@ -91,7 +92,7 @@ class GateIoPerpetualAuth(AuthBase):
 
     def _sign(self, payload) -> str:
         return hmac.new(
-            self.secret_key.encode('utf-8'),
+            self._secret_bytes,
             payload.encode('utf-8'),
             hashlib.sha512).hexdigest()
 
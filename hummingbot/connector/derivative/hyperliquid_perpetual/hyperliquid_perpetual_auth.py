@@ -1,6 +1,5 @@
 import json
 import time
-from collections import OrderedDict
 
 import eth_account
 from eth_abi import encode
@@ -180,7 +179,7 @@ class HyperliquidPerpetualAuth(AuthBase):
         payload = {}
         data = json.loads(params) if params is not None else {}
 
-        request_params = OrderedDict(data or {})
+        request_params = dict(data or {})
 
         request_type = request_params.get("type")
         if request_type == "order":
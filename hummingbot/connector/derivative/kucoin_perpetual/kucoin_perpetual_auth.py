@@ -3,7 +3,6 @@ import hashlib
 import hmac
 import json
 import time
-from collections import OrderedDict
 from decimal import Decimal
 from typing import Any, Dict, List
 from urllib.parse import urlencode
@@ -27,7 +26,7 @@ class KucoinPerpetualAuth(AuthBase):
 
     @staticmethod
     def keysort(dictionary: Dict[str, str]) -> Dict[str, str]:
-        return OrderedDict(sorted(dictionary.items(), key=lambda t: t[0]))
+        return dict(sorted(dictionary.items(), key=lambda t: t[0]))
 
     async def rest_authenticate(self, request: RESTRequest, use_time_provider=0) -> RESTRequest:
         """
@@ -37,11 +36,7 @@ class KucoinPerpetualAuth(AuthBase):
         :param request: the request to be configured for authenticated interaction
         """
 
-        headers = {}
-        if request.headers is not None:
-            headers.update(request.headers)
-        headers.update(self.authentication_headers(request=request, use_time_provider=use_time_provider))
-        request.headers = headers
+        request.headers = {**(request.headers or {}), **self.authentication_headers(request=request, use_time_provider=use_time_provider)}
 
         return request
 
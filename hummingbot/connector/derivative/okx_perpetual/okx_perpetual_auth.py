@@ -75,11 +75,7 @@ class OkxPerpetualAuth(AuthBase):
         Request bodies should have content type application/json and be in valid JSON format.
         """
 
-        headers = {}
-        if request.headers is not None:
-            headers.update(request.headers)
-        headers.update(self.authentication_headers(request=request))
-        request.headers = headers
+        request.headers = {**(request.headers or {}), **self.authentication_headers(request=request)}
 
         return request
 
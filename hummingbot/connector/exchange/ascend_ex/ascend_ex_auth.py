@@ -30,11 +30,7 @@ class AscendExAuth(AuthBase):
             path = path.replace("cash/", "").replace("spot/", "")
         headers_auth = self.get_auth_headers(path)
 
-        headers = {}
-        if request.headers is not None:
-            headers.update(request.headers)
-        headers.update(headers_auth)
-        request.headers = headers
+        request.headers = {**(request.headers or {}), **headers_auth}
 
         return request
 
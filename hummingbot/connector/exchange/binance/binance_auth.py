@@ -1,7 +1,6 @@
 import hashlib
 import hmac
 import json
-from collections import OrderedDict
 from typing import Any, Dict
 from urllib.parse import urlencode
 
@@ -14,6 +13,7 @@ class BinanceAuth(AuthBase):
     def __init__(self, api_key: str, secret_key: str, time_provider: TimeSynchronizer):
         self.api_key = api_key
         self.secret_key = secret_key
+        self._secret_bytes = secret_key.encode("utf8")
         self.time_provider = time_provider
 
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
@@ -27,11 +27,7 @@ class BinanceAuth(AuthBase):
         else:
             request.params = self.add_auth_to_params(params=request.params)
 
-        headers = {}
-        if request.headers is not None:
-            headers.update(request.headers)
-        headers.update(self.header_for_authentication())
-        request.headers = headers
+        request.headers = {**(request.headers or {}), **self.header_for_authentication()}
 
         return request
 
@@ -46,7 +42,7 @@ class BinanceAuth(AuthBase):
                            params: Dict[str, Any]):
         timestamp = int(self.time_provider.time() * 1e3)
 
-        request_params = OrderedDict(params or {})
+        request_params = dict(params or {})
         request_params["timestamp"] = timestamp
 
         signature = self._generate_signature(params=request_params)
@@ -60,5 +56,5 @@ class BinanceAuth(AuthBase):
     def _generate_signature(self, params: Dict[str, Any]) -> str:
 
         encoded_params_str = urlencode(params)
-        digest = hmac.new(self.secret_key.encode("utf8"), encoded_params_str.encode("utf8"), hashlib.sha256).hexdigest()
+        digest = hmac.new(self._secret_bytes, encoded_params_str.encode("utf8"), hashlib.sha256).hexdigest()
         return digest
@@ -31,11 +31,7 @@ class BitmartAuth(AuthBase):
         :return: The RESTRequest with auth information included
         """
 
-        headers = {}
-        if request.headers is not None:
-            headers.update(request.headers)
-        headers.update(self.authentication_headers(request=request))
-        request.headers = headers
+        request.headers = {**(request.headers or {}), **self.authentication_headers(request=request)}
 
         return request
 
@@ -1,7 +1,6 @@
 import hashlib
 import hmac
 import json
-from collections import OrderedDict
 from typing import Any, Dict
 from urllib.parse import urlencode
 
@@ -27,11 +26,7 @@ class BitrueAuth(AuthBase):
         else:
             request.params = self.add_auth_to_params(params=request.params)
 
-        headers = {}
-        if request.headers is not None:
-            headers.update(request.headers)
-        headers.update(self.header_for_authentication())
-        request.headers = headers
+        request.headers = {**(request.headers or {}), **self.header_for_authentication()}
 
         return request
 
@@ -45,7 +40,7 @@ class BitrueAuth(AuthBase):
     def add_auth_to_params(self, params: Dict[str, Any]):
         timestamp = int(self.time_provider.time() * 1e3)
 
-        request_params = OrderedDict(params or {})
+        request_params = dict(params or {})
         request_params["timestamp"] = timestamp
 
         signature = self._generate_signature(params=request_params)
@@ -35,10 +35,7 @@ class BtcMarketsAuth(AuthBase):
             request.data if request.method.name == "POST" else {}
         )
 
-        headers = self._generate_auth_headers(now, sig)
-        if request.headers is not None:
-            headers.update(request.headers)
-        request.headers = headers
+        request.headers = {**self._generate_auth_headers(now, sig), **(request.headers or {})}
 
         return request
 
@@ -1,7 +1,6 @@
 import hashlib
 import hmac
 import time
-from collections import OrderedDict
 from typing import Any, Dict, Optional
 from urllib.parse import urlencode
 
@@ -13,14 +12,22 @@ from hummingbot.core.web_assistant.connections.data_types import RESTRequest, WS
 
 class BybitAuth(AuthBase):
 
+    __slots__ = (
+        "api_key",
+        "secret_key",
+        "_secret_bytes",
+        "time_provider",
+    )
+
     def __init__(self, api_key: str, secret_key: str, time_provider: TimeSynchronizer):
         self.api_key = api_key
         self.secret_key = secret_key
+        self._secret_bytes = secret_key.encode("utf8")
         self.time_provider = time_provider
 
     @staticmethod
     def keysort(dictionary: Dict[str, str]) -> Dict[str, str]:
-        return OrderedDict(sorted(dictionary.items(), key=lambda t: t[0]))
+        return dict(sorted(dictionary.items(), key=lambda t: t[0]))
 
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
         """
@@ -29,10 +36,7 @@ class BybitAuth(AuthBase):
         :param request: the request to be configured for authenticated interaction
         """
         request.params = self.add_auth_to_params(params=request.params)
-        headers = {}
-        if request.headers is not None:
-            headers.update(request.headers)
-        request.headers = headers
+        request.headers = dict(request.headers or {})
         return request
 
     async def ws_authenticate(self, request: WSRequest) -> WSRequest:
@@ -54,7 +58,7 @@ class BybitAuth(AuthBase):
 
     def add_auth_to_params(self,
                            params: Optional[Dict[str, Any]]):
-        timestamp = int(self.time_provider.time() * 1e3)
+        timestamp = self.time_provider.time_ms()
         request_params = params or {}
         request_params["timestamp"] = timestamp
         request_params["api_key"] = self.api_key
@@ -65,7 +69,7 @@ class BybitAuth(AuthBase):
 
     def _generate_signature(self, params: Dict[str, Any]) -> str:
         encoded_params_str = urlencode(params)
-        digest = hmac.new(self.secret_key.encode("utf8"), encoded_params_str.encode("utf8"), hashlib.sha256).hexdigest()
+        digest = hmac.new(self._secret_bytes, encoded_params_str.encode("utf8"), hashlib.sha256).hexdigest()
         return digest
 
     def generate_ws_authentication_message(self):
@@ -75,7 +79,7 @@ class BybitAuth(AuthBase):
         """
         expires = int((self.time_provider.time() + 10) * 1e3)
         _val = f'GET/realtime{expires}'
-        signature = hmac.new(self.secret_key.encode("utf8"),
+        signature = hmac.new(self._secret_bytes,
                              _val.encode("utf8"), hashlib.sha256).hexdigest()
         auth_message = {
             "op": "auth",
@@ -21,11 +21,7 @@ class CubeAuth(AuthBase):
         :param request: the request to be configured for authenticated interaction
         """
 
-        headers = {}
-        if request.headers is not None:
-            headers.update(request.headers)
-        headers.update(self.header_for_authentication())
-        request.headers = headers
+        request.headers = {**(request.headers or {}), **self.header_for_authentication()}
 
         return request
 
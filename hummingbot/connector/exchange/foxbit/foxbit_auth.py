@@ -62,11 +62,7 @@ class FoxbitAuth(AuthBase):
             "X-FB-ACCESS-TIMESTAMP": timestamp,
         }
 
-        headers = {}
-        if request.headers is not None:
-            headers.update(request.headers)
-        headers.update(foxbit_header)
-        request.headers = headers
+        request.headers = {**(request.headers or {}), **foxbit_header}
 
         return request
 
@@ -446,7 +446,9 @@ class FoxbitExchange(ExchangePyBase):
         """
         trading_pair_rules = exchange_info_dict.get("data", [])
         retval = []
-        for rule in filter(foxbit_utils.is_exchange_information_valid, trading_pair_rules):
+        # foxbit_utils.is_exchange_information_valid currently accepts every pair, so the
+        # per-symbol filter call is skipped here until the exchange exposes a status flag
+        for rule in trading_pair_rules:
             try:
                 trading_pair = await self.trading_pair_associated_to_exchange_symbol(symbol=rule.get("symbol"))
 
@@ -907,14 +909,14 @@ class FoxbitExchange(ExchangePyBase):
 
     def _initialize_trading_pair_symbols_from_exchange_info(self, exchange_info: Dict[str, Any]):
         mapping = bidict()
-        for symbol_data in filter(foxbit_utils.is_exchange_information_valid, exchange_info["data"]):
+        for symbol_data in exchange_info["data"]:
             mapping[symbol_data["symbol"]] = combine_to_hb_trading_pair(base=symbol_data['base']['symbol'].upper(),
                                                                         quote=symbol_data['quote']['symbol'].upper())
         self._set_trading_pair_symbol_map(mapping)
 
     def _initialize_trading_pair_instrument_id_from_exchange_info(self, exchange_info: Dict[str, Any]):
         mapping = bidict()
-        for symbol_data in filter(foxbit_utils.is_exchange_information_valid, exchange_info):
+        for symbol_data in exchange_info:
             mapping[symbol_data["InstrumentId"]] = combine_to_hb_trading_pair(symbol_data['Product1Symbol'].upper(),
                                                                               symbol_data['Product2Symbol'].upper())
         self._set_trading_pair_instrument_id_map(mapping)
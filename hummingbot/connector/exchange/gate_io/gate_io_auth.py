@@ -3,7 +3,7 @@ import hmac
 import json
 import time
 from typing import Any, Dict
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 import six
 
@@ -13,22 +13,42 @@ from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTRequest, WSRequest
 
 
+_EMPTY_BODY_HASH = hashlib.sha512().hexdigest()
+
+
 class GateIoAuth(AuthBase):
     """
     Auth Gate.io API
     https://www.gate.io/docs/apiv4/en/#authentication
     """
+
+    __slots__ = (
+        "api_key",
+        "secret_key",
+        "_secret_bytes",
+        "time_provider",
+        "_static_rest_headers",
+        "_static_ws_headers",
+    )
+
     def __init__(self, api_key: str, secret_key: str, time_provider: TimeSynchronizer):
         self.api_key = api_key
         self.secret_key = secret_key
+        self._secret_bytes = secret_key.encode("utf-8")
         self.time_provider = time_provider
+        # Header entries that never change are built once here instead of on every signed request
+        self._static_rest_headers = {
+            "KEY": api_key,
+            "Content-Type": "application/json",
+            "X-Gate-Channel-Id": CONSTANTS.HBOT_BROKER_ID,
+        }
+        self._static_ws_headers = {
+            "method": "api_key",
+            "KEY": api_key,
+        }
 
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
-        headers = {}
-        if request.headers is not None:
-            headers.update(request.headers)
-        headers.update(self._get_auth_headers(request))
-        request.headers = headers
+        request.headers = {**(request.headers or {}), **self._get_auth_headers(request)}
         return request
 
     async def ws_authenticate(self, request: WSRequest) -> WSRequest:
@@ -42,11 +62,8 @@ class GateIoAuth(AuthBase):
         :return: a dictionary with headers
         """
         sig = self._sign_payload_ws(payload['channel'], payload['event'], payload['time'])
-        headers = {
-            "method": "api_key",
-            "KEY": f"{self.api_key}",
-            "SIGN": f"{sig}",
-        }
+        headers = dict(self._static_ws_headers)
+        headers["SIGN"] = f"{sig}"
         return headers
 
     def _get_auth_headers(self, request: RESTRequest) -> Dict[str, Any]:
@@ -56,13 +73,9 @@ class GateIoAuth(AuthBase):
         :return: a dictionary with headers
         """
         sign, ts = self._sign_payload(request)
-        headers = {
-            "KEY": f"{self.api_key}",
-            "SIGN": f"{sign}",
-            "Timestamp": f"{ts}",
-            "Content-Type": "application/json",
-            "X-Gate-Channel-Id": CONSTANTS.HBOT_BROKER_ID,
-        }
+        headers = dict(self._static_rest_headers)
+        headers["SIGN"] = f"{sign}"
+        headers["Timestamp"] = f"{ts}"
         return headers
 
     def _sign_payload_ws(self, channel, event, time) -> str:
@@ -73,14 +86,15 @@ class GateIoAuth(AuthBase):
         body = r.data
 
         ts = time.time()
-        m = hashlib.sha512()
-        path = urlparse(r.url).path
+        path = urlsplit(r.url).path
 
         if body is not None:
             if not isinstance(r.data, six.string_types):
                 body = json.dumps(r.data)
-            m.update(body.encode('utf-8'))
-        body_hash = m.hexdigest()
+            body_hash = hashlib.sha512(body.encode('utf-8')).hexdigest()
+        else:
+            # Most private GETs carry no body; reuse the constant digest of the empty input
+            body_hash = _EMPTY_BODY_HASH
 
         if r.params:
             qs = []
@@ -93,6 +107,6 @@ class GateIoAuth(AuthBase):
 
     def _sign(self, payload) -> str:
         return hmac.new(
-            self.secret_key.encode('utf-8'),
+            self._secret_bytes,
             payload.encode('utf-8'),
             hashlib.sha512).hexdigest()
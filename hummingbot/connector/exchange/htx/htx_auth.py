@@ -1,7 +1,6 @@
-import base64
+import binascii
 import hashlib
 import hmac
-from collections import OrderedDict
 from datetime import datetime
 from typing import Any, Dict
 from urllib.parse import urlencode
@@ -18,11 +17,12 @@ class HtxAuth(AuthBase):
         self.api_key: str = api_key
         self.hostname: str = HTX_HOST_NAME
         self.secret_key: str = secret_key
+        self._secret_bytes = secret_key.encode("utf8")
         self.time_provider = time_provider
 
     @staticmethod
     def keysort(dictionary: Dict[str, str]) -> Dict[str, str]:
-        return OrderedDict(sorted(dictionary.items(), key=lambda t: t[0]))
+        return dict(sorted(dictionary.items(), key=lambda t: t[0]))
 
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
 
@@ -37,7 +37,8 @@ class HtxAuth(AuthBase):
     def generate_auth_params_for_REST(self, request: RESTRequest) -> Dict[str, Any]:
         timestamp = datetime.utcfromtimestamp(self.time_provider.time()).strftime("%Y-%m-%dT%H:%M:%S")
         path_url = f"/v1{request.url.split('v1')[-1]}"
-        params = request.params or {}
+        # Copy so the auth fields are not injected into the caller's params dict
+        params = dict(request.params or {})
         params.update({
             "AccessKeyId": self.api_key,
             "SignatureMethod": "HmacSHA256",
@@ -80,7 +81,7 @@ class HtxAuth(AuthBase):
         query_endpoint = path_url
         encoded_params_str = urlencode(params)
         payload = "\n".join([method.upper(), self.hostname, query_endpoint, encoded_params_str])
-        digest = hmac.new(self.secret_key.encode("utf8"), payload.encode("utf8"), hashlib.sha256).digest()
-        signature_b64 = base64.b64encode(digest).decode()
+        digest = hmac.new(self._secret_bytes, payload.encode("utf8"), hashlib.sha256).digest()
+        signature_b64 = binascii.b2a_base64(digest, newline=False).decode("ascii")
 
         return signature_b64
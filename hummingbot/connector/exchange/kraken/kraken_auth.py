@@ -4,7 +4,7 @@ import hmac
 import json
 import time
 from typing import Any, Dict, Optional
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.core.web_assistant.auth import AuthBase
@@ -28,7 +28,7 @@ class KrakenAuth(AuthBase):
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
 
         data = json.loads(request.data) if request.data is not None else {}
-        _path = urlparse(request.url).path
+        _path = urlsplit(request.url).path
 
         auth_dict: Dict[str, Any] = self._generate_auth_dict(_path, data)
         request.headers = auth_dict["headers"]
@@ -54,11 +54,10 @@ class KrakenAuth(AuthBase):
         # Variables (API method, nonce, and POST data)
         api_path: bytes = bytes(uri, 'utf-8')
         api_nonce: str = self.get_tracking_nonce()
-        api_post: str = "nonce=" + api_nonce
-
+        post_parts = [f"nonce={api_nonce}"]
         if data is not None:
-            for key, value in data.items():
-                api_post += f"&{key}={value}"
+            post_parts.extend(f"{key}={value}" for key, value in data.items())
+        api_post: str = "&".join(post_parts)
 
         # Cryptographic hash algorithms
         api_sha256: bytes = hashlib.sha256(bytes(api_nonce + api_post, 'utf-8')).digest()
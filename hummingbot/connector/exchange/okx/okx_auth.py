@@ -1,8 +1,8 @@
-import base64
+import binascii
 import hashlib
 import hmac
-from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, Optional
 from urllib.parse import urlencode
 
@@ -11,6 +11,13 @@ from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTRequest, WSRequest
 
 
+@lru_cache(maxsize=1024)
+def _path_from_url(url: str) -> str:
+    # Pure function of the URL; the signing path for repeated endpoints is memoized so retries
+    # and status polls skip the string split
+    return f"/api{url.split('/api')[-1]}"
+
+
 class OkxAuth(AuthBase):
 
     def __init__(self, api_key: str, secret_key: str, passphrase: str, time_provider: TimeSynchronizer):
@@ -29,11 +36,7 @@ class OkxAuth(AuthBase):
         :return: The RESTRequest with auth information included
         """
 
-        headers = {}
-        if request.headers is not None:
-            headers.update(request.headers)
-        headers.update(self.authentication_headers(request=request))
-        request.headers = headers
+        request.headers = {**(request.headers or {}), **self.authentication_headers(request=request)}
 
         return request
 
@@ -46,24 +49,23 @@ class OkxAuth(AuthBase):
 
     @staticmethod
     def keysort(dictionary: Dict[str, str]) -> Dict[str, str]:
-        return OrderedDict(sorted(dictionary.items(), key=lambda t: t[0]))
+        return dict(sorted(dictionary.items(), key=lambda t: t[0]))
 
     def _generate_signature(self, timestamp: str, method: str, path_url: str, body: Optional[str] = None) -> str:
-        unsigned_signature = timestamp + method + path_url
-        if body is not None:
-            unsigned_signature += body
+        # Assembled with a single join so no intermediate concatenation results are allocated
+        unsigned_signature = "".join((timestamp, method, path_url, body if body is not None else ""))
 
-        signature = base64.b64encode(
+        signature = binascii.b2a_base64(
             hmac.new(
                 self.secret_key.encode("utf-8"),
                 unsigned_signature.encode("utf-8"),
-                hashlib.sha256).digest()).decode()
+                hashlib.sha256).digest(), newline=False).decode("ascii")
         return signature
 
     def authentication_headers(self, request: RESTRequest) -> Dict[str, Any]:
         timestamp = datetime.utcfromtimestamp(self.time_provider.time()).isoformat(timespec="milliseconds") + "Z"
 
-        path_url = f"/api{request.url.split('/api')[-1]}"
+        path_url = _path_from_url(request.url)
         if request.params:
             query_string_components = urlencode(request.params)
             path_url = f"{path_url}?{query_string_components}"
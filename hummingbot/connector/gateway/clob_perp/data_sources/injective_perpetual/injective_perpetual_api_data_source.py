@@ -711,7 +711,7 @@ class InjectivePerpetualAPIDataSource(CLOBPerpAPIDataSourceBase):
                     start_time=int(order.creation_timestamp * 1e3),
                     limit=CONSTANTS.FETCH_ORDER_HISTORY_LIMIT,
                     skip=skip,
-                    order_types=[CONSTANTS.CLIENT_TO_BACKEND_ORDER_TYPES_MAP[(trade_type, order_type)]],
+                    order_types=[CONSTANTS.CLIENT_TO_BACKEND_ORDER_TYPES_MAP[trade_type][order_type]],
                 )
             if len(response.orders) == 0:
                 search_completed = True
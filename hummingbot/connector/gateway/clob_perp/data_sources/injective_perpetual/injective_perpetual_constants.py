@@ -1,7 +1,7 @@
 import sys
 from configparser import ConfigParser
 from decimal import Decimal
-from typing import Dict, Tuple
+from typing import Dict
 
 from pyinjective.constant import (
     devnet_config as DEVNET_TOKEN_META_CONFIG,
@@ -49,13 +49,18 @@ INJ_DERIVATIVE_ORDER_STATES = {
     "canceled": OrderState.CANCELED,
 }
 
-CLIENT_TO_BACKEND_ORDER_TYPES_MAP: Dict[Tuple[TradeType, OrderType], str] = {
-    (TradeType.BUY, OrderType.LIMIT): "buy",
-    (TradeType.BUY, OrderType.LIMIT_MAKER): "buy_po",
-    (TradeType.BUY, OrderType.MARKET): "take_buy",
-    (TradeType.SELL, OrderType.LIMIT): "sell",
-    (TradeType.SELL, OrderType.LIMIT_MAKER): "sell_po",
-    (TradeType.SELL, OrderType.MARKET): "take_sell",
+# Two-level dispatch (trade type, then order type) so lookups avoid building a tuple key
+CLIENT_TO_BACKEND_ORDER_TYPES_MAP: Dict[TradeType, Dict[OrderType, str]] = {
+    TradeType.BUY: {
+        OrderType.LIMIT: "buy",
+        OrderType.LIMIT_MAKER: "buy_po",
+        OrderType.MARKET: "take_buy",
+    },
+    TradeType.SELL: {
+        OrderType.LIMIT: "sell",
+        OrderType.LIMIT_MAKER: "sell_po",
+        OrderType.MARKET: "take_sell",
+    },
 }
 
 FETCH_ORDER_HISTORY_LIMIT = 100
@@ -24,7 +24,7 @@ class APIKeyStitcher(RESTPreProcessorBase):
         self._api_key = api_key
 
     async def pre_process(self, request: RESTRequest) -> RESTRequest:
-        request.headers = request.headers if request.headers is not None else {}
+        request.headers = request.headers or {}
         if self._api_key is not None and len(self._api_key) > 0:
             request.headers["x-apikey"] = self._api_key
         return request
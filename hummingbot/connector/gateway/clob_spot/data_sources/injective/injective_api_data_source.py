@@ -911,7 +911,7 @@ class InjectiveAPIDataSource(CLOBAPIDataSourceBase):
                 direction=direction,
                 start_time=start_time,
                 skip=skip,
-                order_types=[CLIENT_TO_BACKEND_ORDER_TYPES_MAP[(trade_type, order_type)]]
+                order_types=[CLIENT_TO_BACKEND_ORDER_TYPES_MAP[trade_type][order_type]]
             )
             if len(response.orders) == 0:
                 search_completed = True
@@ -1087,7 +1087,7 @@ class InjectiveAPIDataSource(CLOBAPIDataSourceBase):
 
     @staticmethod
     def _get_backend_order_type(in_flight_order: InFlightOrder) -> str:
-        return CLIENT_TO_BACKEND_ORDER_TYPES_MAP[(in_flight_order.trade_type, in_flight_order.order_type)]
+        return CLIENT_TO_BACKEND_ORDER_TYPES_MAP[in_flight_order.trade_type][in_flight_order.order_type]
 
     @staticmethod
     async def _sleep(delay: float):
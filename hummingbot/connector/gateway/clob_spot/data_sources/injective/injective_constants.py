@@ -1,5 +1,5 @@
 from decimal import Decimal
-from typing import Dict, Tuple
+from typing import Dict
 
 from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.data_type.common import OrderType, TradeType
@@ -13,13 +13,18 @@ LOST_ORDER_COUNT_LIMIT = 10
 ORDER_CHAIN_PROCESSING_TIMEOUT = 5
 MARKETS_UPDATE_INTERVAL = 8 * 60 * 60
 DEFAULT_SUB_ACCOUNT_SUFFIX = "000000000000000000000000"
-CLIENT_TO_BACKEND_ORDER_TYPES_MAP: Dict[Tuple[TradeType, OrderType], str] = {
-    (TradeType.BUY, OrderType.LIMIT): "buy",
-    (TradeType.BUY, OrderType.LIMIT_MAKER): "buy_po",
-    (TradeType.BUY, OrderType.MARKET): "take_buy",
-    (TradeType.SELL, OrderType.LIMIT): "sell",
-    (TradeType.SELL, OrderType.LIMIT_MAKER): "sell_po",
-    (TradeType.SELL, OrderType.MARKET): "take_sell",
+# Two-level dispatch (trade type, then order type) so lookups avoid building a tuple key
+CLIENT_TO_BACKEND_ORDER_TYPES_MAP: Dict[TradeType, Dict[OrderType, str]] = {
+    TradeType.BUY: {
+        OrderType.LIMIT: "buy",
+        OrderType.LIMIT_MAKER: "buy_po",
+        OrderType.MARKET: "take_buy",
+    },
+    TradeType.SELL: {
+        OrderType.LIMIT: "sell",
+        OrderType.LIMIT_MAKER: "sell_po",
+        OrderType.MARKET: "take_sell",
+    },
 }
 
 BACKEND_TO_CLIENT_ORDER_STATE_MAP = {
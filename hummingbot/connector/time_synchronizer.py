@@ -53,6 +53,15 @@ class TimeSynchronizer:
         """
         return self._current_seconds_counter() + self.time_offset_ms * 1e-3
 
+    def time_ms(self) -> int:
+        """
+        Returns the current time in integer milliseconds calculated base on the deviation samples.
+        Request signing paths that need millisecond timestamps can use this directly and skip
+        the float seconds round-trip of `int(time() * 1e3)`.
+        :return: Calculated current time in milliseconds considering the registered deviations
+        """
+        return int(self._current_seconds_counter() * 1e3 + self.time_offset_ms)
+
     async def update_server_time_offset_with_time_provider(self, time_provider: Awaitable):
         """
         Executes the time_provider passed as parameter to obtain the current time, and adds a new sample in the
@@ -6,6 +6,17 @@ import base58
 from pydantic import BaseModel, validator
 
 
+def generate_executor_id(timestamp: float) -> str:
+    """
+    Generates the unique base58 identifier used for executor configs. Exposed at module level so
+    callers that build configs with `construct()` (skipping validators) can still assign an id.
+    """
+    unique_component = random.randint(0, 99999)
+    raw_id = f"{timestamp}-{unique_component}"
+    hashed_id = hashlib.sha256(raw_id.encode()).digest()  # Get bytes
+    return base58.b58encode(hashed_id).decode()  # Base58 encode
+
+
 class ExecutorConfigBase(BaseModel):
     id: str = None  # Make ID optional
     type: str
@@ -17,10 +28,7 @@ class ExecutorConfigBase(BaseModel):
         if v is None:
             # Use timestamp from values if available, else current time
             timestamp = values.get('timestamp', time.time())
-            unique_component = random.randint(0, 99999)
-            raw_id = f"{timestamp}-{unique_component}"
-            hashed_id = hashlib.sha256(raw_id.encode()).digest()  # Get bytes
-            return base58.b58encode(hashed_id).decode()  # Base58 encode
+            return generate_executor_id(timestamp)
         return v
 
 
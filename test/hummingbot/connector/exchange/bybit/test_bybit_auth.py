@@ -21,6 +21,7 @@ class BybitAuthTests(TestCase):
 
         self.mock_time_provider = MagicMock()
         self.mock_time_provider.time.return_value = 1000
+        self.mock_time_provider.time_ms.return_value = 1000000
 
         self.auth = BybitAuth(
             api_key=self.api_key,
@@ -22,6 +22,7 @@ class KucoinAuthTests(TestCase):
 
         self.mock_time_provider = MagicMock()
         self.mock_time_provider.time.return_value = 1000
+        self.mock_time_provider.time_ms.return_value = 1000000
 
         self.auth = KucoinAuth(
             api_key=self.api_key,
@@ -29,6 +29,17 @@ class TimeSynchronizerTests(TestCase):
         synchronized_time = time_provider.time()
         self.assertEqual(now + (2 - 3), synchronized_time)
 
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._time")
+    def test_time_ms_with_registered_offsets_returns_local_time(self, time_mock, seconds_counter_mock):
+        now = 1640000000.0
+        time_mock.side_effect = [now]
+        seconds_counter_mock.side_effect = [2, 3]
+        time_provider = TimeSynchronizer()
+
+        synchronized_time_ms = time_provider.time_ms()
+        self.assertEqual(int((now + (2 - 3)) * 1e3), synchronized_time_ms)
+
     @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
     @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._time")
     def test_time_with_one_registered_offset(self, _, seconds_counter_mock):